@@ -1,30 +1,78 @@
 import argparse
+import functools
+import hashlib
+import io
+import math
 import os
 import platform
 import re
 import shutil
 import subprocess
 import tempfile
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
-
-from git import InvalidGitRepositoryError, Repo
-from dotenv import load_dotenv
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
+    from git import Repo
     from google.genai import Client as GeminiClient
     from openai import OpenAI as OpenAIClient
 else:
     GeminiClient = Any
     OpenAIClient = Any
 
+
+def load_env_file() -> None:
+    """Lädt die .env-Datei neben dem Skript, python-dotenv nur wenn sie existiert."""
+    env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+    if not os.path.isfile(env_path):
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_path)
+
+
+def getenv_int(name: str, default: int) -> int:
+    """Liest eine Ganzzahl aus der Umgebung; ungültige Werte ergeben den Standard."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        print(f"Warnung: {name}={raw!r} ist keine ganze Zahl, verwende {default}.")
+        return default
+
+
 # .env-Datei laden
-load_dotenv()
+load_env_file()
 
 # Defaults und Konfiguration
 DEFAULT_LANGUAGE = os.getenv("COMMIT_LANGUAGE", "Deutsch")
 DEFAULT_MODE = os.getenv("COMMIT_MODE", "provider").lower()
 DEFAULT_PROVIDER = os.getenv("AI_PROVIDER", "gemini").lower()
 DEFAULT_NO_PUSH = os.getenv("NO_PUSH", "false").lower() == "true"
+DEFAULT_INLINE_DIFF = os.getenv("INLINE_DIFF", "false").lower() == "true"
+DEFAULT_NO_CACHE = os.getenv("NO_CACHE", "false").lower() == "true"
+DEFAULT_SUMMARIZE_LARGE_DIFFS = (
+    os.getenv("SUMMARIZE_LARGE_DIFFS", "false").lower() == "true"
+)
+COMMIT_CACHE_TTL = getenv_int("COMMIT_CACHE_TTL", 86400)
+TRIVIAL_DIFF_LINES = getenv_int("TRIVIAL_DIFF_LINES", 0)
 DEFAULT_MACOS_SHORTCUT_NAME = os.getenv(
     "MACOS_SHORTCUT_NAME", "auto-commit-chatgpt"
 )
@@ -79,11 +127,48 @@ parser.add_argument(
     action="store_true",
     default=None,
 )
+parser.add_argument(
+    "--no-cache",
+    help="Antwort-Cache für AI-Nachrichten umgehen",
+    action="store_true",
+    default=None,
+)
+parser.add_argument(
+    "--summarize-large-diffs",
+    help=(
+        "Zu große Diffs abschnittsweise parallel zusammenfassen lassen, "
+        "statt sie für den Prompt zu kürzen"
+    ),
+    action="store_true",
+    default=None,
+)
 parser.add_argument(
     "--no-editor",
     help="Editor nicht öffnen, AI-Nachricht direkt verwenden",
     action="store_true",
 )
+parser.add_argument(
+    "--inline-diff",
+    help="Vollständige Diffs direkt im Commit-Template anzeigen",
+    action="store_true",
+    default=None,
+)
+parser.add_argument(
+    "--edit-while-generating",
+    help=(
+        "Editor sofort öffnen und die AI-Nachricht parallel generieren; "
+        "leer gelassene Nachricht übernimmt den AI-Vorschlag"
+    ),
+    action="store_true",
+)
+parser.add_argument(
+    "--no-llm-shortcuts",
+    help=(
+        "Auch für triviale Änderungen (reine Renames, Whitespace, Löschungen, "
+        "Lockfiles) die AI bzw. den Shortcut fragen"
+    ),
+    action="store_true",
+)
 parser.add_argument(
     "--auto-add",
     help="Alle untracked und modifizierte Dateien automatisch hinzufügen",
@@ -101,8 +186,17 @@ COMMIT_MODE = (args.mode or DEFAULT_MODE).lower()
 AI_PROVIDER = (args.provider or DEFAULT_PROVIDER).lower()
 COMMIT_STYLE = (args.style or "standard").lower()
 NO_PUSH = args.no_push if args.no_push is not None else DEFAULT_NO_PUSH
+NO_CACHE = args.no_cache if args.no_cache is not None else DEFAULT_NO_CACHE
+SUMMARIZE_LARGE_DIFFS = (
+    args.summarize_large_diffs
+    if args.summarize_large_diffs is not None
+    else DEFAULT_SUMMARIZE_LARGE_DIFFS
+)
 NO_EDITOR = args.no_editor or args.yolo
+INLINE_DIFF = args.inline_diff if args.inline_diff is not None else DEFAULT_INLINE_DIFF
 AUTO_ADD = args.auto_add or args.yolo
+EDIT_WHILE_GENERATING = args.edit_while_generating and not NO_EDITOR
+NO_LLM_SHORTCUTS = args.no_llm_shortcuts
 MACOS_SHORTCUT_NAME = args.shortcut_name or DEFAULT_MACOS_SHORTCUT_NAME
 
 if AI_PROVIDER == "gemini":
@@ -118,6 +212,48 @@ MODEL_NAME = args.model or default_model
 ZAI_BASE_URL = args.zai_base_url or DEFAULT_ZAI_BASE_URL
 OPENAI_BASE_URL = args.openai_base_url or DEFAULT_OPENAI_BASE_URL
 
+# Obergrenze für die Diff-Inhalte im Prompt (in Zeichen)
+MAX_PROMPT_DIFF_SIZE = 48 * 1024
+# Maximale Länge lokal erzeugter Summary-Zeilen, wie im Prompt gefordert
+MAX_SUBJECT_LENGTH = 72
+BINARY_DIFF_PATTERN = re.compile(r"^Binary files .* differ$", re.M)
+DIFF_HEADER_PATTERN = re.compile(r"^diff --git (.*)$", re.M)
+DIFF_HEADER_PATHS_PATTERN = re.compile(r"a/(.*) b/\1")
+# Nur Optionen ohne Nebenwirkung: core.untrackedCache würde eine Erweiterung
+# in den Index des Nutzers schreiben und bleibt daher ein bewusstes Opt-in.
+STATUS_CONFIG_OPTIONS = ["core.preloadindex=true"]
+LOCKFILE_NAMES = {
+    "Cargo.lock",
+    "Gemfile.lock",
+    "Pipfile.lock",
+    "composer.lock",
+    "go.sum",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "poetry.lock",
+    "uv.lock",
+    "yarn.lock",
+}
+
+GENERATING_PLACEHOLDER = (
+    "# [AI-Commit-Nachricht wird generiert. Leer lassen, um den Vorschlag "
+    "zu übernehmen.]"
+)
+
+PROVIDER_API_KEYS = {
+    "gemini": GEMINI_API_KEY,
+    "zai": ZAI_API_KEY,
+    "openai": OPENAI_API_KEY,
+}
+PROVIDER_BASE_URLS = {
+    "gemini": None,
+    "zai": ZAI_BASE_URL,
+    "openai": OPENAI_BASE_URL,
+}
+
+
+T = TypeVar("T")
+
 
 class CommitGenerationError(RuntimeError):
     """Signalisiert Fehler bei der KI-Commit-Generierung, bei denen das Tool abbrechen sollte."""
@@ -132,7 +268,7 @@ def dependency_repair_hint() -> str:
     )
 
 
-def load_gemini_client() -> "GeminiClient":
+def load_gemini_client(api_key: str) -> "GeminiClient":
     """Importiert den Gemini-Client erst bei Bedarf."""
     try:
         from google import genai
@@ -142,7 +278,7 @@ def load_gemini_client() -> "GeminiClient":
             f"{dependency_repair_hint()} Ursprünglicher Fehler: {exc}"
         ) from exc
 
-    return genai.Client(api_key=GEMINI_API_KEY)
+    return genai.Client(api_key=api_key)
 
 
 def load_openai_client(api_key: str, base_url: Optional[str] = None) -> "OpenAIClient":
@@ -162,6 +298,10 @@ def load_openai_client(api_key: str, base_url: Optional[str] = None) -> "OpenAIC
 
 def find_git_root(path: str) -> Optional[str]:
     """Findet das Root-Verzeichnis des Git-Repositories."""
+    # GitPython erst hier laden, damit --help und Aufrufe außerhalb eines
+    # Repositories den Import sparen.
+    from git import InvalidGitRepositoryError, Repo
+
     try:
         repo = Repo(path, search_parent_directories=True)
         if not repo.working_tree_dir:
@@ -171,72 +311,404 @@ def find_git_root(path: str) -> Optional[str]:
         return None
 
 
-def get_staged_and_deleted_files(repo: Repo) -> Tuple[List[str], List[str]]:
+def scan_worktree(repo: "Repo") -> Tuple[List[str], List[str], List[str], List[str]]:
+    """Liefert untracked, ungestagte, gestagte und gestagt gelöschte Dateien."""
+    # Ein einziger Status-Lauf statt is_dirty, untracked_files und index.diff(None).
+    # Die Index-Spalte entspricht dabei "git diff --cached --name-status".
+    # preloadindex verteilt die lstat()-Aufrufe auf mehrere Threads.
+    status = repo.git(c=STATUS_CONFIG_OPTIONS).status(
+        "--porcelain=v2", "-z", "--untracked-files=all"
+    )
+    tokens = iter(status.split("\x00"))
+    untracked: List[str] = []
+    unstaged: List[str] = []
+    staged: List[str] = []
+    deleted: List[str] = []
+    for entry in tokens:
+        if not entry:
+            continue
+        kind = entry[0]
+        if kind == "?":
+            untracked.append(entry[2:])
+            continue
+        if kind == "1":
+            fields = entry.split(" ", 8)
+            path = fields[8]
+        elif kind == "2":
+            fields = entry.split(" ", 9)
+            path = fields[9]
+            next(tokens)  # Ursprungspfad des Renames
+        elif kind == "u":
+            fields = entry.split(" ", 10)
+            path = fields[10]
+            staged.append(path)
+            unstaged.append(path)
+            continue
+        else:
+            continue
+
+        index_status, worktree_status = fields[1]
+        if index_status == "D":
+            deleted.append(path)
+        elif index_status != ".":
+            staged.append(path)
+        if worktree_status != ".":
+            unstaged.append(path)
+    return untracked, unstaged, staged, deleted
+
+
+def has_remote(repo: "Repo", name: str) -> bool:
+    """Prüft, ob ein Remote existiert, ohne alle Remotes zu laden."""
+    try:
+        repo.remote(name)
+    except ValueError:
+        return False
+    return True
+
+
+def get_staged_and_deleted_files(repo: "Repo") -> Tuple[List[str], List[str]]:
     """Liefert gestagte Dateien sowie gelöschte Dateien getrennt."""
-    staged = repo.git.diff("--cached", "--name-only").splitlines()
-    deleted = repo.git.diff("--cached", "--diff-filter=D", "--name-only").splitlines()
-    staged_non_deleted = [path for path in staged if path not in deleted]
+    # -z liefert "<STATUS>\0<PFAD>\0" (bei Renames/Kopien zusätzlich den Zielpfad)
+    # und vermeidet Quoting bei Leerzeichen oder Umlauten.
+    tokens = iter(repo.git.diff("--cached", "--name-status", "-z").split("\x00"))
+    staged_non_deleted: List[str] = []
+    deleted: List[str] = []
+    for status in tokens:
+        if not status:
+            continue
+        path = next(tokens)
+        if status[0] in "RC":
+            path = next(tokens)
+        if status[0] == "D":
+            deleted.append(path)
+        else:
+            staged_non_deleted.append(path)
     return staged_non_deleted, deleted
 
 
-def get_diff_for_file(repo: Repo, file_path: str) -> str:
+def get_diff_for_file(repo: "Repo", file_path: str) -> str:
     """Diff der gestagten Änderungen für eine Datei."""
-    return repo.git.diff("--cached", "--", file_path)
+    # Direkter git-Aufruf statt repo.git, damit die Funktion threadsicher bleibt.
+    result = subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo.working_tree_dir),
+            "-c",
+            "core.quotepath=false",
+            "diff",
+            "--cached",
+            "--",
+            file_path,
+        ],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+    return result.stdout.rstrip("\n")
+
+
+def get_all_staged_diffs(repo: "Repo", files: List[str]) -> Dict[str, str]:
+    """Diffs der gestagten Änderungen für mehrere Dateien mit einem einzigen git-Aufruf."""
+    if not files:
+        return {}
+
+    # Ganzen Index in einem Lauf diffen, statt alle Pfade als Argumente zu
+    # übergeben (sprengt bei sehr großen Commits sonst ARG_MAX). --no-renames
+    # entspricht dem Ergebnis der früheren Einzel-Diffs pro Pfad, quotepath=false
+    # hält Umlaute in den Headern lesbar.
+    output = repo.git(c="core.quotepath=false").diff("--cached", "--no-renames")
+    headers = [
+        (DIFF_HEADER_PATHS_PATTERN.fullmatch(match.group(1)), match.start())
+        for match in DIFF_HEADER_PATTERN.finditer(output)
+    ]
+
+    diffs: Dict[str, str] = {}
+    for index, (path_match, start) in enumerate(headers):
+        if path_match is None:
+            continue
+        end = headers[index + 1][1] if index + 1 < len(headers) else len(output)
+        diffs[path_match.group(1)] = output[start:end].rstrip("\n")
+
+    # Pfade, die sich nicht eindeutig zuordnen lassen (z. B. gequotete Namen),
+    # einzeln und parallel nachladen.
+    missing = [file for file in files if file not in diffs]
+    if missing:
+        max_workers = min(16, (os.cpu_count() or 4) * 2, len(missing))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            diffs.update(
+                zip(
+                    missing,
+                    executor.map(functools.partial(get_diff_for_file, repo), missing),
+                )
+            )
+    return {file: diffs[file] for file in files}
 
 
+@functools.lru_cache(maxsize=4)
 def create_ai_clients(
-    provider: str, zai_base_url: str
+    provider: str, api_key: Optional[str], base_url: Optional[str] = None
 ) -> Tuple[Optional["GeminiClient"], Optional["OpenAIClient"]]:
-    """Initialisiert die AI-Clients abhängig vom Provider."""
+    """Initialisiert die AI-Clients abhängig vom Provider (einmal pro Konfiguration)."""
+    if provider not in {"gemini", "zai", "openai"}:
+        raise ValueError(f"Unbekannter Provider: {provider}")
+
+    if not api_key:
+        raise ValueError(
+            f"{provider.upper()}_API_KEY ist nicht gesetzt. "
+            "Bitte füge ihn in die .env-Datei ein."
+        )
+
     if provider == "gemini":
-        if not GEMINI_API_KEY:
-            raise ValueError(
-                "GEMINI_API_KEY ist nicht gesetzt. Bitte füge ihn in die .env-Datei ein."
-            )
-        return load_gemini_client(), None
-    if provider == "zai":
-        if not ZAI_API_KEY:
-            raise ValueError(
-                "ZAI_API_KEY ist nicht gesetzt. Bitte füge ihn in die .env-Datei ein."
-            )
-        return None, load_openai_client(api_key=ZAI_API_KEY, base_url=zai_base_url)
+        return load_gemini_client(api_key), None
+    return None, load_openai_client(api_key=api_key, base_url=base_url)
+
+
+def allocate_diff_budgets(sizes: Dict[str, int], budget: int) -> Dict[str, int]:
+    """Verteilt das Zeichenbudget logarithmisch gewichtet auf die Dateien."""
+    limits: Dict[str, int] = {}
+    pending = dict(sizes)
+    remaining = budget
+    while pending:
+        weights = {path: math.log2(size + 2) for path, size in pending.items()}
+        total_weight = sum(weights.values())
+        fitting = [
+            path
+            for path, size in pending.items()
+            if size <= remaining * weights[path] / total_weight
+        ]
+        if not fitting:
+            for path in pending:
+                limits[path] = int(remaining * weights[path] / total_weight)
+            break
+        # Kleine Diffs komplett übernehmen, den Rest neu verteilen
+        for path in fitting:
+            limits[path] = pending.pop(path)
+            remaining -= limits[path]
+    return limits
+
+
+def shorten_diff(diff: str, limit: int) -> str:
+    """Behält Anfang und Ende eines Diffs und markiert die Kürzung."""
+    if len(diff) <= limit:
+        return diff
+    head = diff[: limit // 2]
+    tail = diff[len(diff) - limit // 2 :]
+    # An Zeilengrenzen schneiden, damit keine halben Diff-Zeilen entstehen
+    head = head[: head.rfind("\n") + 1] or head
+    tail = tail[tail.find("\n") + 1 :] or tail
+    skipped = len(diff) - len(head) - len(tail)
+    return f"{head}... [{skipped} Zeichen gekürzt] ...\n{tail}"
+
+
+def truncate_diffs(file_diffs: Dict[str, str], max_size: int) -> Dict[str, str]:
+    """Begrenzt die Diffs für den Prompt auf insgesamt max_size Zeichen."""
+    diffs = {
+        path: (
+            "Binärdatei geändert (Diff ausgelassen)"
+            if BINARY_DIFF_PATTERN.search(diff)
+            else diff
+        )
+        for path, diff in file_diffs.items()
+    }
+    if sum(len(diff) for diff in diffs.values()) <= max_size:
+        return diffs
 
-    if provider == "openai":
-        if not OPENAI_API_KEY:
-            raise ValueError(
-                "OPENAI_API_KEY ist nicht gesetzt. Bitte füge ihn in die .env-Datei ein."
-            )
-        return None, load_openai_client(
-            api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL
+    limits = allocate_diff_budgets(
+        {path: len(diff) for path, diff in diffs.items()}, max_size
+    )
+    return {path: shorten_diff(diff, limits[path]) for path, diff in diffs.items()}
+
+
+def split_changed_lines(diffs: List[str]) -> Optional[Tuple[List[str], List[str]]]:
+    """Sammelt entfernte und hinzugefügte Zeilen aus reinen Text-Änderungen.
+
+    Gibt None zurück, sobald ein Diff binär ist oder eine Datei anlegt bzw. löscht.
+    """
+    removed: List[str] = []
+    added: List[str] = []
+    for diff in diffs:
+        if (
+            BINARY_DIFF_PATTERN.search(diff)
+            or "\nnew file mode" in diff
+            or "\ndeleted file mode" in diff
+        ):
+            return None
+        in_hunk = False
+        for line in diff.split("\n"):
+            if line.startswith("@@"):
+                in_hunk = True
+            elif in_hunk and line.startswith("+"):
+                added.append(line[1:])
+            elif in_hunk and line.startswith("-"):
+                removed.append(line[1:])
+    return removed, added
+
+
+def is_whitespace_only_change(repo: "Repo", diffs: List[str]) -> bool:
+    """Prüft, ob sich die gestagten Änderungen nur in Leerraum unterscheiden."""
+    changed = split_changed_lines(diffs)
+    # Reine Modusänderungen hat "git diff -w" ebenfalls nicht als Unterschied.
+    if changed is None or not any(changed) or any("\nold mode " in d for d in diffs):
+        return False
+
+    # Notwendige Bedingung ohne Prozessstart: ohne Leerraum müssen entfernte
+    # und hinzugefügte Zeilen übereinstimmen. Das schließt fast jede echte
+    # Änderung aus, verschobene Zeilen erkennt es aber nicht.
+    removed, added = changed
+    if "".join("".join(removed).split()) != "".join("".join(added).split()):
+        return False
+
+    # git vergleicht Hunk für Hunk; verschobene Zeilen bleiben ein Unterschied.
+    result = subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo.working_tree_dir),
+            "diff",
+            "--cached",
+            "--ignore-all-space",
+            "--ignore-blank-lines",
+            "--quiet",
+        ],
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def describe_updated_files(paths: List[str], noun: str) -> str:
+    """Summary-Zeile für aktualisierte Dateien, bei Überlänge nur mit Anzahl."""
+    subject = f"chore: update {', '.join(paths)}"
+    if len(subject) <= MAX_SUBJECT_LENGTH:
+        return subject
+    return f"chore: update {len(paths)} {noun}"
+
+
+def describe_trivial_changes(
+    repo: "Repo",
+    staged_files: List[str],
+    deleted_files: List[str],
+    file_diffs: Dict[str, str],
+    max_trivial_lines: int = 0,
+) -> Optional[str]:
+    """Erzeugt für triviale Änderungen eine Commit-Nachricht ohne AI-Aufruf.
+
+    Mit max_trivial_lines > 0 gelten auch kleine Text-Änderungen unterhalb
+    dieser Zeilenzahl als trivial.
+    """
+    if deleted_files and not staged_files:
+        return f"chore: remove {len(deleted_files)} file(s)"
+
+    if (
+        len(staged_files) == 1
+        and not deleted_files
+        and "\nnew file mode" in file_diffs.get(staged_files[0], "")
+    ):
+        # Eine einzelne neue Datei kann ein reiner Rename sein.
+        tokens = repo.git.diff(
+            "--cached", "--name-status", "-z", "--diff-filter=R"
+        ).split("\x00")
+        for index in range(0, len(tokens) - 2, 3):
+            status, old_path, new_path = tokens[index : index + 3]
+            if status == "R100" and new_path == staged_files[0]:
+                return f"refactor: rename {old_path} -> {new_path}"
+
+    if not deleted_files and is_whitespace_only_change(
+        repo, list(file_diffs.values())
+    ):
+        return "chore: whitespace-only cleanup"
+
+    if (
+        staged_files
+        and not deleted_files
+        and all(os.path.basename(path) in LOCKFILE_NAMES for path in staged_files)
+    ):
+        return describe_updated_files(staged_files, "lockfile(s)")
+
+    if max_trivial_lines > 0 and staged_files and not deleted_files:
+        changed = split_changed_lines(
+            [file_diffs.get(path, "") for path in staged_files]
         )
+        if changed is not None and 0 < sum(map(len, changed)) < max_trivial_lines:
+            return describe_updated_files(staged_files, "file(s)")
 
-    raise ValueError(f"Unbekannter Provider: {provider}")
+    return None
 
 
 def build_commit_prompt(
     file_diffs: Dict[str, str], commit_language: str, commit_style: str
 ) -> str:
     """Baut den Prompt für die Commit-Generierung."""
-    prompt_parts: List[str] = [
-        (
-            f"Erstelle eine prägnante Git-Commit-Nachricht in der Sprache {commit_language}. "
-            "Nutze eine kurze Summary-Zeile (max 72 Zeichen) und optional einen Body mit kurzen Bullet Points. "
-            "Verwende kein Markdown-Formatting wie ``` oder Überschriften. "
-        )
-    ]
+    buffer = io.StringIO()
+    buffer.write(
+        f"Erstelle eine prägnante Git-Commit-Nachricht in der Sprache {commit_language}. "
+        "Nutze eine kurze Summary-Zeile (max 72 Zeichen) und optional einen Body mit kurzen Bullet Points. "
+        "Verwende kein Markdown-Formatting wie ``` oder Überschriften. "
+    )
 
     if commit_style in ("humorous", "sarcastic"):
-        prompt_parts[0] += (
+        buffer.write(
             f"Der Commit-Stil ist '{commit_style}'. "
             "Verwende trockenen, subtilen Sarkasmus oder Humor, "
             "bleibe fachlich korrekt, verständlich und git-konform. "
             "Keine Albernheit, keine Memes."
         )
 
+    for file_path, diff in truncate_diffs(file_diffs, MAX_PROMPT_DIFF_SIZE).items():
+        buffer.write("\n\nDatei: ")
+        buffer.write(file_path)
+        buffer.write("\nÄnderungen:\n")
+        buffer.write(diff)
+
+    return buffer.getvalue()
+
+
+def split_diffs_into_chunks(
+    file_diffs: Dict[str, str], max_size: int
+) -> List[Dict[str, str]]:
+    """Verteilt die Diffs in Dateireihenfolge auf Abschnitte bis max_size Zeichen."""
+    chunks: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    current_size = 0
+    for path, diff in file_diffs.items():
+        if BINARY_DIFF_PATTERN.search(diff):
+            diff = "Binärdatei geändert (Diff ausgelassen)"
+        # Einzelne Riesen-Diffs werden wie bisher gekürzt
+        diff = shorten_diff(diff, max_size)
+        if current and current_size + len(diff) > max_size:
+            chunks.append(current)
+            current, current_size = {}, 0
+        current[path] = diff
+        current_size += len(diff)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_summary_prompt(file_diffs: Dict[str, str], commit_language: str) -> str:
+    """Baut den Prompt für die Zusammenfassung eines Diff-Abschnitts."""
+    buffer = io.StringIO()
+    buffer.write(
+        f"Fasse die folgenden Git-Änderungen in der Sprache {commit_language} "
+        "in wenigen kurzen Stichpunkten zusammen. Nenne nur, was sich fachlich "
+        "ändert, ohne Einleitung und ohne Markdown-Überschriften."
+    )
     for file_path, diff in file_diffs.items():
-        prompt_parts.append(f"Datei: {file_path}\nÄnderungen:\n{diff}")
+        buffer.write("\n\nDatei: ")
+        buffer.write(file_path)
+        buffer.write("\nÄnderungen:\n")
+        buffer.write(diff)
+    return buffer.getvalue()
 
-    return "\n\n".join(prompt_parts)
+
+def collapse_blank_runs(text: str) -> str:
+    """Reduziert drei oder mehr aufeinanderfolgende Zeilenumbrüche auf zwei."""
+    # str.replace läuft komplett in C und ist bei kurzen Texten schneller als re.sub
+    while "\n\n\n" in text:
+        text = text.replace("\n\n\n", "\n\n")
+    return text
 
 
 def normalize_commit_message(message: str) -> str:
@@ -246,7 +718,88 @@ def normalize_commit_message(message: str) -> str:
         return "chore: update changes"
 
     # Mehrere Leerzeilen reduzieren, sonst nichts verändern
-    return re.sub(r"\n{3,}", "\n\n", message)
+    return collapse_blank_runs(message)
+
+
+def get_cache_dir() -> str:
+    """Verzeichnis für zwischengespeicherte Commit-Nachrichten."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "auto-commit")
+
+
+def commit_cache_key(
+    provider: str,
+    model_name: str,
+    commit_language: str,
+    commit_style: str,
+    prompt: str,
+) -> str:
+    """Cache-Schlüssel aus Provider, Modell, Sprache, Stil und Prompt."""
+    payload = "\x00".join((provider, model_name, commit_language, commit_style, prompt))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def remove_file_quietly(path: str) -> None:
+    """Löscht eine Datei und ignoriert dabei Fehler."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def prune_commit_cache(cache_dir: str) -> None:
+    """Entfernt abgelaufene Einträge und liegengebliebene Temp-Dateien."""
+    cutoff = time.time() - COMMIT_CACHE_TTL
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.name.endswith((".txt", ".tmp"))
+                    and entry.stat().st_mtime < cutoff
+                ):
+                    remove_file_quietly(entry.path)
+    except OSError:
+        pass
+
+
+def read_cached_commit_message(cache_key: str) -> Optional[str]:
+    """Liest eine noch gültige Commit-Nachricht aus dem Cache.
+
+    Abgelaufene Einträge werden dabei gelöscht.
+    """
+    cache_path = os.path.join(get_cache_dir(), f"{cache_key}.txt")
+    try:
+        if time.time() - os.stat(cache_path).st_mtime > COMMIT_CACHE_TTL:
+            remove_file_quietly(cache_path)
+            return None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+def write_cached_commit_message(cache_key: str, message: str) -> None:
+    """Schreibt eine Commit-Nachricht atomar in den Cache.
+
+    Räumt vorher abgelaufene Einträge anderer Schlüssel weg.
+    """
+    cache_dir = get_cache_dir()
+    tmp_path: Optional[str] = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        prune_commit_cache(cache_dir)
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=cache_dir, delete=False, suffix=".tmp", encoding="utf-8"
+        ) as cache_file:
+            tmp_path = cache_file.name
+            cache_file.write(message)
+        os.replace(tmp_path, os.path.join(cache_dir, f"{cache_key}.txt"))
+    except OSError:
+        # Der Cache ist optional, Schreibfehler dürfen den Commit nicht verhindern.
+        if tmp_path is not None:
+            remove_file_quietly(tmp_path)
 
 
 def ensure_macos_shortcut_available(shortcut_name: str) -> None:
@@ -286,6 +839,65 @@ def ensure_macos_shortcut_available(shortcut_name: str) -> None:
         )
 
 
+def stream_completion(
+    prompt: str,
+    provider: str,
+    model_name: str,
+    gemini_client: Optional["GeminiClient"],
+    zai_client: Optional["OpenAIClient"],
+) -> Iterator[str]:
+    """Schickt den Prompt an den Provider und liefert die Antwort in Teilstücken."""
+    if provider == "gemini":
+        if gemini_client is None:
+            raise CommitGenerationError("Gemini-Client fehlt.")
+        stream = gemini_client.models.generate_content_stream(
+            model=model_name, contents=prompt
+        )
+        return (getattr(chunk, "text", "") or "" for chunk in stream)
+    if provider in {"zai", "openai"}:
+        if zai_client is None:
+            raise CommitGenerationError("OpenAI-kompatibler Client fehlt.")
+        stream = zai_client.chat.completions.create(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+        )
+        return (
+            chunk.choices[0].delta.content or ""
+            for chunk in stream
+            if chunk.choices
+        )
+    raise CommitGenerationError(f"Unbekannter Provider: {provider}")
+
+
+def summarize_file_diffs(
+    file_diffs: Dict[str, str],
+    provider: str,
+    model_name: str,
+    commit_language: str,
+    gemini_client: Optional["GeminiClient"],
+    zai_client: Optional["OpenAIClient"],
+    echo: bool = False,
+) -> Dict[str, str]:
+    """Fasst Diff-Abschnitte parallel zusammen, Schlüssel sind die Dateilisten."""
+    chunks = split_diffs_into_chunks(file_diffs, MAX_PROMPT_DIFF_SIZE)
+    if echo:
+        print(
+            f"\nFasse {len(chunks)} Diff-Abschnitte parallel zusammen ...",
+            flush=True,
+        )
+
+    def summarize(chunk: Dict[str, str]) -> str:
+        prompt = build_summary_prompt(chunk, commit_language)
+        return "".join(
+            stream_completion(prompt, provider, model_name, gemini_client, zai_client)
+        ).strip()
+
+    with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+        summaries = list(executor.map(summarize, chunks))
+    return {", ".join(chunk): summary for chunk, summary in zip(chunks, summaries)}
+
+
 def generate_commit_message(
     file_diffs: Dict[str, str],
     provider: str,
@@ -294,32 +906,70 @@ def generate_commit_message(
     commit_style: str,
     gemini_client: Optional["GeminiClient"],
     zai_client: Optional["OpenAIClient"],
+    echo: bool = False,
+    use_cache: bool = True,
+    summarize_large_diffs: bool = False,
 ) -> str:
-    """Generiert eine Commit-Nachricht basierend auf den Dateidiffs."""
+    """Generiert eine Commit-Nachricht basierend auf den Dateidiffs.
+
+    Die Antwort wird gestreamt; mit echo=True erscheinen die Teilstücke sofort
+    auf stdout. Ohne echo wird nichts ausgegeben, Fehler kommen dann als
+    CommitGenerationError beim Aufrufer an. Mit use_cache=False wird der Antwort-Cache weder gelesen noch
+    geschrieben. Mit summarize_large_diffs=True werden Diffs über dem
+    Prompt-Budget erst abschnittsweise zusammengefasst statt gekürzt.
+    """
     prompt = build_commit_prompt(file_diffs, commit_language, commit_style)
+    summarize = (
+        summarize_large_diffs
+        and sum(len(diff) for diff in file_diffs.values()) > MAX_PROMPT_DIFF_SIZE
+    )
+    cache_key = commit_cache_key(
+        provider,
+        model_name,
+        commit_language,
+        f"{commit_style}+summary" if summarize else commit_style,
+        prompt,
+    )
+    cached_message = read_cached_commit_message(cache_key) if use_cache else None
+    if cached_message is not None:
+        if echo:
+            print("\nCommit-Nachricht aus dem Cache übernommen.")
+        return cached_message
+
+    if echo:
+        # Sofortige Rückmeldung, bis das erste Token eintrifft
+        print(
+            f"\nGeneriere Commit-Nachricht mit {provider} ({model_name}) ...\n",
+            flush=True,
+        )
 
+    buffer = io.StringIO()
     try:
-        if provider == "gemini":
-            if gemini_client is None:
-                raise CommitGenerationError("Gemini-Client fehlt.")
-            response = gemini_client.models.generate_content(
-                model=model_name, contents=prompt
-            )
-            message = getattr(response, "text", "") or ""
-        elif provider in {"zai", "openai"}:
-            if zai_client is None:
-                raise CommitGenerationError("OpenAI-kompatibler Client fehlt.")
-            response = zai_client.chat.completions.create(
-                model=model_name,
-                messages=[{"role": "user", "content": prompt}],
+        if summarize:
+            prompt = build_commit_prompt(
+                summarize_file_diffs(
+                    file_diffs,
+                    provider,
+                    model_name,
+                    commit_language,
+                    gemini_client,
+                    zai_client,
+                    echo,
+                ),
+                commit_language,
+                commit_style,
             )
-            message = (
-                response.choices[0].message.content
-                if response and response.choices
-                else ""
-            )
-        else:
-            raise CommitGenerationError(f"Unbekannter Provider: {provider}")
+
+        chunks = stream_completion(
+            prompt, provider, model_name, gemini_client, zai_client
+        )
+        for text in chunks:
+            buffer.write(text)
+            if echo:
+                print(text, end="", flush=True)
+        if echo and buffer.tell():
+            print()
+        message = buffer.getvalue()
     except Exception as exc:  # pragma: no cover - defensive fallback
         # Bei 429/RESOURCE_EXHAUSTED sofort abbrechen, statt mit altem Template fortzufahren.
         if "429" in str(exc) or "RESOURCE_EXHAUSTED" in str(exc):
@@ -327,10 +977,19 @@ def generate_commit_message(
                 "KI-Commit-Generierung fehlgeschlagen (429 RESOURCE_EXHAUSTED). "
                 "Bitte später erneut versuchen oder das Kontingent anpassen."
             ) from exc
+        if not echo:
+            # Im Hintergrund gehört das Terminal dem Editor; der Fehler wird
+            # erst vom Aufrufer ausgegeben.
+            raise CommitGenerationError(
+                f"Fehler bei der Commit-Generierung: {exc}"
+            ) from exc
         print(f"Fehler bei der Commit-Generierung: {exc}")
         return "chore: update changes"
 
-    return normalize_commit_message(message)
+    commit_message = normalize_commit_message(message)
+    if use_cache and (message or "").strip():
+        write_cached_commit_message(cache_key, commit_message)
+    return commit_message
 
 
 def generate_commit_message_with_shortcut(
@@ -382,16 +1041,39 @@ end run
     return normalize_commit_message(result.stdout)
 
 
+def run_in_background(func: Callable[[], T]) -> "Future[T]":
+    """Startet func in einem Daemon-Thread.
+
+    Anders als bei ThreadPoolExecutor wartet das Programmende nicht auf den
+    Thread, ein nicht mehr benötigtes Ergebnis hält den Prozess also nicht auf.
+    """
+    future: "Future[T]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 def prompt_to_stage(
-    repo: Repo,
+    repo: "Repo",
     files: List[str],
     label: str,
     add_all: bool = False,
     auto_add: bool = False,
-) -> None:
-    """Fragt, ob Dateien gestagt werden sollen, und führt das Staging aus."""
+) -> bool:
+    """Fragt, ob Dateien gestagt werden sollen, und führt das Staging aus.
+
+    Gibt zurück, ob der Index verändert wurde.
+    """
     if not files:
-        return
+        return False
 
     print(f"\n{label} gefunden:")
     for file in files:
@@ -403,7 +1085,7 @@ def prompt_to_stage(
         else:
             repo.git.add(files)
         print(f"{label} wurden automatisch hinzugefügt.")
-        return
+        return True
 
     user_input = (
         input(f"\nMöchtest du alle {label.lower()} hinzufügen? (y/n): ").strip().lower()
@@ -414,41 +1096,96 @@ def prompt_to_stage(
         else:
             repo.git.add(files)
         print(f"{label} wurden hinzugefügt.")
-    else:
-        print(f"{label} wurden nicht hinzugefügt.")
+        return True
+
+    print(f"{label} wurden nicht hinzugefügt.")
+    return False
 
 
 def write_commit_template(
-    file_path: str,
+    f: TextIO,
     commit_message: str,
     modified_files: List[str],
     deleted_files: List[str],
     file_diffs: Dict[str, str],
+    diff_path: Optional[str] = None,
 ) -> None:
-    """Schreibt die Commit-Nachricht plus Kontext in eine temporäre Datei."""
-    with open(file_path, "w") as f:
-        f.write(commit_message)
-        f.write(
-            "\n\n# Bitte gib die Commit-Nachricht für deine Änderungen ein. Zeilen, die\n"
-        )
-        f.write(
-            "# mit # beginnen, werden ignoriert, und eine leere Nachricht bricht den Commit ab.\n"
-        )
-        f.write("#\n# Zu übernehmende Änderungen:\n")
-
-        for file in modified_files:
-            f.write(f"#\t{file}\n")
-        if deleted_files:
-            f.write("#\n# Gelöschte Dateien:\n")
-            for file in deleted_files:
-                f.write(f"#\t{file} (gelöscht)\n")
+    """Schreibt die Commit-Nachricht plus Kontext in die geöffnete Template-Datei.
+
+    Mit diff_path wird statt der vollständigen Diffs nur ein Verweis auf die
+    separate Diff-Datei eingetragen.
+    """
+    f.write(commit_message)
+    f.write(
+        "\n\n# Bitte gib die Commit-Nachricht für deine Änderungen ein. Zeilen, die\n"
+    )
+    f.write(
+        "# mit # beginnen, werden ignoriert, und eine leere Nachricht bricht den Commit ab.\n"
+    )
+    f.write("#\n# Zu übernehmende Änderungen:\n")
+
+    for file in modified_files:
+        f.write(f"#\t{file}\n")
+    if deleted_files:
+        f.write("#\n# Gelöschte Dateien:\n")
+        for file in deleted_files:
+            f.write(f"#\t{file} (gelöscht)\n")
+
+    f.write("#\n")
+    if diff_path is not None:
+        f.write(f"# Vollständiger Diff: {diff_path}\n")
+        return
 
+    for file, diff in file_diffs.items():
+        f.write(f"# Changes in {file}:\n")
+        if diff:
+            # splitlines trennt auch an einzelnen \r; beim Einlesen mit
+            # universellen Zeilenumbrüchen entstünden sonst Zeilen ohne "#".
+            f.write("\n".join(f"# {line}" for line in diff.splitlines()))
+            f.write("\n")
         f.write("#\n")
-        for file, diff in file_diffs.items():
-            f.write(f"# Changes in {file}:\n")
-            for line in diff.splitlines():
-                f.write(f"# {line}\n")
-            f.write("#\n")
+
+
+def edit_commit_message(
+    commit_message: str,
+    modified_files: List[str],
+    deleted_files: List[str],
+    file_diffs: Dict[str, str],
+) -> str:
+    """Öffnet das Commit-Template im Editor und liefert die bereinigte Nachricht."""
+    fd, tmp_path = tempfile.mkstemp(suffix=".txt")
+    diff_path: Optional[str] = None
+    try:
+        if not INLINE_DIFF and file_diffs:
+            # Diffs in eine eigene Datei auslagern, damit der Editor nur die
+            # eigentliche Nachricht laden muss.
+            diff_fd, diff_path = tempfile.mkstemp(suffix=".diff")
+            with os.fdopen(diff_fd, "w", buffering=1 << 20) as f:
+                for diff in file_diffs.values():
+                    f.write(diff)
+                    f.write("\n")
+
+        with os.fdopen(fd, "w", buffering=1 << 20) as f:
+            write_commit_template(
+                f, commit_message, modified_files, deleted_files, file_diffs, diff_path
+            )
+
+        editor = os.getenv("EDITOR", "vim")
+        subprocess.call([editor, tmp_path])
+
+        # Neu einlesen, da viele Editoren die Datei ersetzen statt sie zu überschreiben
+        try:
+            text = Path(tmp_path).read_text()
+        except FileNotFoundError:
+            # Gelöschtes Template zählt wie eine leere Nachricht.
+            text = ""
+        return "\n".join(
+            line for line in text.split("\n") if not line.startswith("#")
+        ).strip()
+    finally:
+        remove_file_quietly(tmp_path)
+        if diff_path is not None:
+            remove_file_quietly(diff_path)
 
 
 def main() -> None:
@@ -457,24 +1194,46 @@ def main() -> None:
         print("Fehler: Kein Git-Repository gefunden.")
         return
 
+    from git import Repo
+
     repo = Repo(git_root)
 
+    untracked_files, unstaged_files, staged_files, deleted_files = scan_worktree(repo)
+
     # Check auf jegliche Änderungen
-    if not repo.is_dirty(untracked_files=True):
+    if not (untracked_files or unstaged_files or staged_files or deleted_files):
         print("Keine Änderungen zum Committen.")
         return
 
-    untracked_files = repo.untracked_files
-    unstaged_files = [
-        cast(str, item.a_path) for item in repo.index.diff(None) if item.a_path
-    ]
+    # SDK-Import und Client-Aufbau laufen im Hintergrund, während die
+    # Staging-Fragen beantwortet werden. Der Daemon-Thread hält Läufe, die
+    # keinen Client brauchen, beim Beenden nicht auf.
+    clients_future: Optional[
+        "Future[Tuple[Optional[GeminiClient], Optional[OpenAIClient]]]"
+    ] = None
+    if COMMIT_MODE == "provider" and AI_PROVIDER in PROVIDER_API_KEYS:
+        clients_future = run_in_background(
+            functools.partial(
+                create_ai_clients,
+                AI_PROVIDER,
+                PROVIDER_API_KEYS[AI_PROVIDER],
+                PROVIDER_BASE_URLS[AI_PROVIDER],
+            )
+        )
 
-    prompt_to_stage(
+    index_changed = prompt_to_stage(
         repo, untracked_files, "Untracked Files", add_all=True, auto_add=AUTO_ADD
     )
-    prompt_to_stage(repo, unstaged_files, "unstaged Dateien", auto_add=AUTO_ADD)
+    # "git add --all" hat die ungestagten Änderungen bereits mit aufgenommen;
+    # ein zweites "git add" bzw. eine zweite Nachfrage ist dann überflüssig.
+    if not index_changed:
+        index_changed = prompt_to_stage(
+            repo, unstaged_files, "unstaged Dateien", auto_add=AUTO_ADD
+        )
 
-    staged_files, deleted_files = get_staged_and_deleted_files(repo)
+    # Der Index aus dem ersten Status-Lauf gilt nur, solange nichts gestagt wurde.
+    if index_changed:
+        staged_files, deleted_files = get_staged_and_deleted_files(repo)
     if not staged_files and not deleted_files:
         print(
             "Keine gestagten Änderungen gefunden. Bitte Dateien zum Committen hinzufügen."
@@ -488,11 +1247,19 @@ def main() -> None:
         )
         return
 
-    file_diffs = {
-        file: get_diff_for_file(repo, file) for file in staged_files + deleted_files
-    }
+    file_diffs = get_all_staged_diffs(repo, staged_files + deleted_files)
 
-    if COMMIT_MODE == "provider":
+    trivial_message = (
+        None
+        if NO_LLM_SHORTCUTS
+        else describe_trivial_changes(
+            repo, staged_files, deleted_files, file_diffs, TRIVIAL_DIFF_LINES
+        )
+    )
+
+    if trivial_message is not None:
+        print("\nTriviale Änderung erkannt, Commit-Nachricht wird lokal erzeugt.")
+    elif COMMIT_MODE == "provider":
         if AI_PROVIDER not in {"gemini", "zai", "openai"}:
             print(
                 "Ungültiger Provider. Bitte 'gemini', 'zai' oder 'openai' wählen "
@@ -501,92 +1268,117 @@ def main() -> None:
             return
 
         try:
-            gemini_client, zai_client = create_ai_clients(AI_PROVIDER, ZAI_BASE_URL)
+            if clients_future is None:
+                gemini_client, zai_client = create_ai_clients(
+                    AI_PROVIDER,
+                    PROVIDER_API_KEYS[AI_PROVIDER],
+                    PROVIDER_BASE_URLS[AI_PROVIDER],
+                )
+            else:
+                gemini_client, zai_client = clients_future.result()
         except ValueError as exc:
             print(exc)
             return
 
+        generate = functools.partial(
+            generate_commit_message,
+            file_diffs=file_diffs,
+            provider=AI_PROVIDER,
+            model_name=MODEL_NAME,
+            commit_language=COMMIT_LANGUAGE,
+            commit_style=COMMIT_STYLE,
+            gemini_client=gemini_client,
+            zai_client=zai_client,
+            echo=not EDIT_WHILE_GENERATING,
+            use_cache=not NO_CACHE,
+            summarize_large_diffs=SUMMARIZE_LARGE_DIFFS,
+        )
+    else:
+        generate = functools.partial(
+            generate_commit_message_with_shortcut,
+            file_diffs=file_diffs,
+            commit_language=COMMIT_LANGUAGE,
+            commit_style=COMMIT_STYLE,
+            shortcut_name=MACOS_SHORTCUT_NAME,
+        )
+
+    if trivial_message is not None:
+        pending_message: Optional["Future[str]"] = None
+        commit_message = trivial_message
+    elif EDIT_WHILE_GENERATING:
+        # Die KI-Anfrage läuft im Hintergrund, während der Editor offen ist.
+        pending_message = run_in_background(generate)
+        commit_message = GENERATING_PLACEHOLDER
+    else:
+        pending_message = None
         try:
-            commit_message = generate_commit_message(
-                file_diffs=file_diffs,
-                provider=AI_PROVIDER,
-                model_name=MODEL_NAME,
-                commit_language=COMMIT_LANGUAGE,
-                commit_style=COMMIT_STYLE,
-                gemini_client=gemini_client,
-                zai_client=zai_client,
-            )
-        except CommitGenerationError as exc:
+            commit_message = generate()
+        except (CommitGenerationError, ValueError) as exc:
             print(exc)
             return
+        commit_message = commit_message or "chore: update changes"
+
+    if NO_EDITOR:
+        final_commit_message = commit_message
     else:
+        final_commit_message = edit_commit_message(
+            commit_message, staged_files, deleted_files, file_diffs
+        )
+
+    # Eine eigene Nachricht aus dem Editor hat Vorrang; auf den KI-Vorschlag
+    # wird nur gewartet, wenn die Nachricht leer geblieben ist.
+    if pending_message is not None and not final_commit_message:
+        if not pending_message.done():
+            print("Warte auf die KI-Commit-Nachricht ...")
         try:
-            commit_message = generate_commit_message_with_shortcut(
-                file_diffs=file_diffs,
-                commit_language=COMMIT_LANGUAGE,
-                commit_style=COMMIT_STYLE,
-                shortcut_name=MACOS_SHORTCUT_NAME,
-            )
+            generated_message = pending_message.result()
         except (CommitGenerationError, ValueError) as exc:
             print(exc)
             return
+        final_commit_message = generated_message or "chore: update changes"
 
-    commit_message = commit_message or "chore: update changes"
-
-    tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".txt")
-    tmp_path = tmp_file.name
-    tmp_file.close()
+    if not final_commit_message:
+        print("Commit-Nachricht leer. Abbruch.")
+        return
 
-    try:
-        write_commit_template(
-            tmp_path, commit_message, staged_files, deleted_files, file_diffs
+    print("\n===== Änderungen für den Commit =====")
+    # Zeigt auch Branch sowie übrig gebliebene ungestagte und untracked Dateien
+    print(repo.git(c=STATUS_CONFIG_OPTIONS).status())
+    print("\n===== Vorgeschlagene bzw. angepasste Commit-Nachricht =====")
+    print(final_commit_message)
+
+    if not args.yolo:
+        user_input = (
+            input("\nMöchtest du diese Änderungen committen? (y/n): ")
+            .strip()
+            .lower()
         )
-
-        if NO_EDITOR:
-            final_commit_message = commit_message
-        else:
-            editor = os.getenv("EDITOR", "vim")
-            subprocess.call([editor, tmp_path])
-
-            with open(tmp_path, "r") as f:
-                lines = f.readlines()
-                final_commit_message = "".join(
-                    line for line in lines if not line.startswith("#")
-                ).strip()
-
-        if not final_commit_message:
-            print("Commit-Nachricht leer. Abbruch.")
+        if user_input != "y":
+            print("Commit abgebrochen.")
             return
 
-        with open(tmp_path, "w") as f:
-            f.write(final_commit_message)
-
-        print("\n===== Änderungen für den Commit =====")
-        print(repo.git.status())
-        print("\n===== Vorgeschlagene bzw. angepasste Commit-Nachricht =====")
-        print(final_commit_message)
-
-        if not args.yolo:
-            user_input = (
-                input("\nMöchtest du diese Änderungen committen? (y/n): ")
-                .strip()
-                .lower()
-            )
-            if user_input != "y":
-                print("Commit abgebrochen.")
-                return
-
-        subprocess.run(["git", "commit", "-F", tmp_path], check=False)
+    push = not NO_PUSH and has_remote(repo, "origin")
+    # Die Nachricht geht per stdin an git, es wird keine Datei mehr geschrieben.
+    command = "git commit -F -"
+    if push:
+        # Ein Shell-Aufruf für beides; gepusht wird nur nach erfolgreichem Commit.
+        # Exit-Code 2 kennzeichnet einen fehlgeschlagenen Push.
+        command += " && { git push origin || exit 2; }"
+    result = subprocess.run(
+        command, shell=True, input=final_commit_message, text=True, check=False
+    )
 
-        if NO_PUSH:
-            print("Git Push wurde übersprungen (--no-push aktiv).")
-        elif "origin" in [remote.name for remote in repo.remotes]:
-            repo.remote("origin").push()
-        else:
-            print("Kein 'origin' Remote gefunden. Überspringe 'git push'.")
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    if push and result.returncode == 2:
+        print(
+            "Commit wurde erstellt, aber 'git push' ist fehlgeschlagen. "
+            "Später mit 'git push origin' erneut versuchen."
+        )
+    elif result.returncode != 0:
+        print("Commit fehlgeschlagen.")
+    elif NO_PUSH:
+        print("Git Push wurde übersprungen (--no-push aktiv).")
+    elif not push:
+        print("Kein 'origin' Remote gefunden. Überspringe 'git push'.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+import contextlib
+import importlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Tuple
+from unittest import mock
+
+from git import Repo
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def import_auto_commit():
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    with mock.patch.object(sys, "argv", ["autocommit"]):
+        return importlib.import_module("auto_commit")
+
+
+auto_commit = import_auto_commit()
+
+
+class TemporaryRepoTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = Path(self.tmpdir.name)
+        self.git("init", "-q")
+        self.git("config", "user.email", "test@example.com")
+        self.git("config", "user.name", "Test")
+        self.repo = Repo(self.root)
+
+    def git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", str(self.root), *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    def write(self, path: str, content: str) -> None:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+
+    def commit_all(self) -> None:
+        self.git("add", "--all")
+        self.git("commit", "-q", "-m", "init")
+
+    def run_main(self, **settings: Any) -> Tuple[str, mock.Mock]:
+        """Führt main() ohne Editor, Rückfragen und echten Provider im Repo aus."""
+        generate = mock.Mock(return_value="feat: generated message")
+        overrides = {
+            "COMMIT_MODE": "provider",
+            "AI_PROVIDER": "gemini",
+            "NO_EDITOR": True,
+            "AUTO_ADD": True,
+            "NO_PUSH": False,
+            "NO_CACHE": True,
+            "NO_LLM_SHORTCUTS": False,
+            "EDIT_WHILE_GENERATING": False,
+            "create_ai_clients": mock.Mock(return_value=(None, None)),
+            "generate_commit_message": generate,
+            **settings,
+        }
+        stdout = io.StringIO()
+        previous_cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            with contextlib.ExitStack() as stack:
+                for name, value in overrides.items():
+                    stack.enter_context(mock.patch.object(auto_commit, name, value))
+                stack.enter_context(mock.patch.object(auto_commit.args, "yolo", True))
+                stack.enter_context(contextlib.redirect_stdout(stdout))
+                auto_commit.main()
+        finally:
+            os.chdir(previous_cwd)
+        return stdout.getvalue(), generate
@@ -0,0 +1,71 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from support import TemporaryRepoTestCase
+
+PUSH_FAILED = "Commit wurde erstellt, aber 'git push' ist fehlgeschlagen."
+
+
+class CommitAndPushTest(TemporaryRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        remote_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(remote_dir.cleanup)
+        self.remote = Path(remote_dir.name)
+        subprocess.run(["git", "init", "-q", "--bare", str(self.remote)], check=True)
+
+        self.write("a.txt", "a\n")
+        self.commit_all()
+        self.git("remote", "add", "origin", str(self.remote))
+        self.git("push", "-q", "-u", "origin", "HEAD")
+        self.write("a.txt", "a\nb\n")
+        self.git("add", "a.txt")
+
+    def install_hook(self, hooks_dir: Path, name: str) -> None:
+        hook = hooks_dir / name
+        hook.write_text("#!/bin/sh\nexit 1\n", encoding="utf-8")
+        hook.chmod(0o755)
+
+    def remote_head(self) -> str:
+        return subprocess.run(
+            ["git", "-C", str(self.remote), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    def test_commit_is_pushed_to_origin(self) -> None:
+        output, _ = self.run_main()
+
+        self.assertNotIn(PUSH_FAILED, output)
+        self.assertNotIn("Commit fehlgeschlagen.", output)
+        self.assertEqual(self.remote_head(), self.git("rev-parse", "HEAD").strip())
+
+    def test_rejected_push_keeps_the_commit(self) -> None:
+        before = self.remote_head()
+        self.install_hook(self.remote / "hooks", "pre-receive")
+
+        output, _ = self.run_main()
+
+        self.assertIn(PUSH_FAILED, output)
+        self.assertEqual(
+            self.git("log", "-1", "--format=%s").strip(), "feat: generated message"
+        )
+        self.assertEqual(self.remote_head(), before)
+
+    def test_failed_commit_is_not_reported_as_push_failure(self) -> None:
+        head = self.git("rev-parse", "HEAD").strip()
+        self.install_hook(self.root / ".git" / "hooks", "pre-commit")
+
+        output, _ = self.run_main()
+
+        self.assertIn("Commit fehlgeschlagen.", output)
+        self.assertNotIn(PUSH_FAILED, output)
+        self.assertEqual(self.git("rev-parse", "HEAD").strip(), head)
+        self.assertEqual(self.remote_head(), head)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import auto_commit
+
+
+class CommitCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache_dir = Path(auto_commit.get_cache_dir())
+
+    def age(self, path: Path) -> None:
+        past = time.time() - auto_commit.COMMIT_CACHE_TTL - 60
+        os.utime(path, (past, past))
+
+    def test_round_trip(self) -> None:
+        auto_commit.write_cached_commit_message("key", "feat: cached")
+
+        self.assertEqual(auto_commit.read_cached_commit_message("key"), "feat: cached")
+        self.assertEqual(list(self.cache_dir.glob("*.tmp")), [])
+
+    def test_expired_entry_is_removed_on_read(self) -> None:
+        auto_commit.write_cached_commit_message("key", "feat: old")
+        self.age(self.cache_dir / "key.txt")
+
+        self.assertIsNone(auto_commit.read_cached_commit_message("key"))
+        self.assertFalse((self.cache_dir / "key.txt").exists())
+
+    def test_write_prunes_expired_entries_and_leftover_temp_files(self) -> None:
+        auto_commit.write_cached_commit_message("old", "feat: old")
+        leftover = self.cache_dir / "leftover.tmp"
+        leftover.write_text("x", encoding="utf-8")
+        self.age(self.cache_dir / "old.txt")
+        self.age(leftover)
+
+        auto_commit.write_cached_commit_message("new", "feat: new")
+
+        self.assertEqual(
+            sorted(path.name for path in self.cache_dir.iterdir()), ["new.txt"]
+        )
+
+    def test_failed_write_removes_temp_file(self) -> None:
+        with mock.patch.object(auto_commit.os, "replace", side_effect=OSError):
+            auto_commit.write_cached_commit_message("key", "feat: lost")
+
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_invalid_ttl_falls_back_to_default(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "auto_commit.py", "--help"],
+            capture_output=True,
+            text=True,
+            check=False,
+            env={**os.environ, "COMMIT_CACHE_TTL": "1d"},
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("COMMIT_CACHE_TTL='1d'", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import contextlib
+import io
+import os
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from support import TemporaryRepoTestCase, auto_commit
+
+
+class CommitTemplateTest(unittest.TestCase):
+    def test_inline_diff_with_lone_carriage_return_stays_commented(self) -> None:
+        diff = "diff --git a/f b/f\n+foo\rSECRET LINE\n+bar"
+
+        with mock.patch.object(auto_commit, "INLINE_DIFF", True), mock.patch.dict(
+            os.environ, {"EDITOR": "true"}
+        ):
+            message = auto_commit.edit_commit_message("msg", ["f"], [], {"f": diff})
+
+        self.assertEqual(message, "msg")
+
+
+    def test_editor_deleting_the_template_does_not_crash_cleanup(self) -> None:
+        with mock.patch.dict(os.environ, {"EDITOR": "rm"}):
+            message = auto_commit.edit_commit_message(
+                "msg", ["f"], [], {"f": "diff --git a/f b/f\n+x"}
+            )
+
+        self.assertEqual(message, "")
+
+
+class TrivialChangesTest(TemporaryRepoTestCase):
+    def describe(self) -> object:
+        staged, deleted = auto_commit.get_staged_and_deleted_files(self.repo)
+        diffs = auto_commit.get_all_staged_diffs(self.repo, staged + deleted)
+        return auto_commit.describe_trivial_changes(self.repo, staged, deleted, diffs)
+
+    def last_subject(self) -> str:
+        return self.git("log", "-1", "--format=%s").strip()
+
+    def test_reindented_code_is_whitespace_only(self) -> None:
+        self.write("m.py", "def f():\n    return 1\n")
+        self.commit_all()
+        self.write("m.py", "def f():\n\n        return 1\n")
+        self.git("add", "m.py")
+
+        self.assertEqual(self.describe(), "chore: whitespace-only cleanup")
+
+    def test_real_change_is_rejected_without_asking_git(self) -> None:
+        self.write("m.py", "def f():\n    return 1\n")
+        self.commit_all()
+        self.write("m.py", "def f():\n    return 2\n")
+        self.git("add", "m.py")
+
+        with mock.patch.object(
+            auto_commit.subprocess, "run", wraps=auto_commit.subprocess.run
+        ) as run:
+            self.assertIsNone(self.describe())
+
+        self.assertFalse(
+            any("--ignore-all-space" in call.args[0] for call in run.call_args_list)
+        )
+
+    def test_moved_line_is_not_whitespace_only(self) -> None:
+        self.write("m.py", "X = 1\nY = 2\nZ = 3\n")
+        self.commit_all()
+        self.write("m.py", "Y = 2\nZ = 3\nX = 1\n")
+        self.git("add", "m.py")
+
+        self.assertIsNone(self.describe())
+
+    def test_line_moved_between_files_is_not_whitespace_only(self) -> None:
+        self.write("a.py", "X = 1\nA = 1\n")
+        self.write("b.py", "B = 1\n")
+        self.commit_all()
+        self.write("a.py", "A = 1\n")
+        self.write("b.py", "B = 1\nX = 1\n")
+        self.git("add", "--all")
+
+        self.assertIsNone(self.describe())
+
+    def test_mode_change_is_not_whitespace_only(self) -> None:
+        self.write("run.sh", "echo hi\n")
+        self.commit_all()
+        self.write("run.sh", "echo  hi\n")
+        (self.root / "run.sh").chmod(0o755)
+        self.git("add", "run.sh")
+
+        self.assertIsNone(self.describe())
+
+    def test_lockfile_updates_keep_the_subject_short(self) -> None:
+        packages = [f"packages/service-{index}" for index in range(6)]
+        for package in packages:
+            self.write(f"{package}/package-lock.json", "{}\n")
+        self.commit_all()
+        self.write("uv.lock", "neu\n")
+        self.git("add", "uv.lock")
+
+        self.assertEqual(self.describe(), "chore: update uv.lock")
+
+        for package in packages:
+            self.write(f"{package}/package-lock.json", '{"v": 2}\n')
+        self.git("add", "--all")
+
+        self.assertEqual(self.describe(), "chore: update 7 lockfile(s)")
+
+
+    def test_pure_rename_is_described_locally(self) -> None:
+        self.write("old.py", "X = 1\n")
+        self.commit_all()
+        self.git("mv", "old.py", "new.py")
+
+        self.assertEqual(self.describe(), "refactor: rename old.py -> new.py")
+
+    def test_rename_with_changes_is_not_trivial(self) -> None:
+        self.write("old.py", "X = 1\nY = 2\nZ = 3\n")
+        self.commit_all()
+        self.git("mv", "old.py", "new.py")
+        self.write("new.py", "X = 1\nY = 2\nZ = 4\n")
+        self.git("add", "new.py")
+
+        self.assertIsNone(self.describe())
+
+    def test_deletions_only_are_described_locally(self) -> None:
+        self.write("a.txt", "a\n")
+        self.write("b.txt", "b\n")
+        self.commit_all()
+        self.git("rm", "-q", "a.txt", "b.txt")
+
+        self.assertEqual(self.describe(), "chore: remove 2 file(s)")
+
+    def test_no_llm_shortcuts_sends_trivial_changes_to_the_provider(self) -> None:
+        self.write("a.txt", "a\n")
+        self.write("b.txt", "b\n")
+        self.commit_all()
+        self.git("rm", "-q", "a.txt")
+
+        _, generate = self.run_main(NO_LLM_SHORTCUTS=True, NO_PUSH=True)
+
+        generate.assert_called_once()
+        self.assertEqual(self.last_subject(), "feat: generated message")
+
+        self.git("rm", "-q", "b.txt")
+        _, generate = self.run_main(NO_PUSH=True)
+
+        generate.assert_not_called()
+        self.assertEqual(self.last_subject(), "chore: remove 1 file(s)")
+
+
+class GenerateCommitMessageTest(unittest.TestCase):
+    def test_background_errors_are_raised_instead_of_printed(self) -> None:
+        def fail(**kwargs: object) -> None:
+            raise RuntimeError("timeout")
+
+        client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=fail))
+        )
+        stdout = io.StringIO()
+
+        with contextlib.redirect_stdout(stdout), self.assertRaisesRegex(
+            auto_commit.CommitGenerationError, "timeout"
+        ):
+            auto_commit.generate_commit_message(
+                {"f": "diff"},
+                "openai",
+                "model",
+                "Deutsch",
+                "standard",
+                None,
+                client,
+                echo=False,
+                use_cache=False,
+            )
+        self.assertEqual(stdout.getvalue(), "")
+
+
+
+class RunInBackgroundTest(unittest.TestCase):
+    def test_runs_on_a_daemon_thread_and_returns_the_result(self) -> None:
+        release = threading.Event()
+
+        def work() -> bool:
+            release.wait(5)
+            return threading.current_thread().daemon
+
+        future = auto_commit.run_in_background(work)
+        self.assertFalse(future.done())
+        release.set()
+
+        self.assertTrue(future.result(timeout=5))
+
+    def test_exceptions_are_delivered_through_the_future(self) -> None:
+        def fail() -> None:
+            raise ValueError("kein Key")
+
+        with self.assertRaisesRegex(ValueError, "kein Key"):
+            auto_commit.run_in_background(fail).result(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
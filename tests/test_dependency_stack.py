@@ -21,6 +21,14 @@ class DependencyStackTest(unittest.TestCase):
         self.assertIn('autocommit = "auto_commit:main"', pyproject)
         self.assertFalse(Path("requirements.txt").exists())
 
+    def test_only_current_gemini_sdk_is_locked(self) -> None:
+        pyproject = Path("pyproject.toml").read_text(encoding="utf-8")
+        lockfile = Path("uv.lock").read_text(encoding="utf-8")
+
+        self.assertIn('"google-genai>=1.73.0"', pyproject)
+        self.assertNotIn("google-generativeai", pyproject)
+        self.assertNotIn('name = "google-generativeai"', lockfile)
+
     def test_local_binary_uses_uv_run(self) -> None:
         wrapper = Path.home().joinpath(".local/bin/autocommit")
         if not wrapper.exists():
@@ -0,0 +1,71 @@
+import unittest
+
+from support import auto_commit
+
+
+class DiffBudgetTest(unittest.TestCase):
+    def test_small_diffs_stay_whole_next_to_a_huge_one(self) -> None:
+        limits = auto_commit.allocate_diff_budgets(
+            {"a.py": 10, "b.py": 20, "big.py": 100_000}, 1000
+        )
+
+        self.assertEqual(limits, {"a.py": 10, "b.py": 20, "big.py": 970})
+
+    def test_budget_is_split_when_nothing_fits(self) -> None:
+        limits = auto_commit.allocate_diff_budgets({"a": 5000, "b": 5000}, 1000)
+
+        self.assertEqual(limits, {"a": 500, "b": 500})
+
+    def test_zero_budget_leaves_nothing(self) -> None:
+        self.assertEqual(auto_commit.allocate_diff_budgets({"a": 10}, 0), {"a": 0})
+        self.assertEqual(auto_commit.allocate_diff_budgets({}, 100), {})
+
+    def test_shorten_diff_cuts_at_line_boundaries(self) -> None:
+        diff = "l1\nl2\nl3\nl4\n"
+
+        self.assertEqual(auto_commit.shorten_diff(diff, len(diff)), diff)
+        self.assertEqual(
+            auto_commit.shorten_diff(diff, 8), "l1\n... [6 Zeichen gekürzt] ...\nl4\n"
+        )
+
+    def test_shorten_diff_with_tiny_limit_keeps_only_the_marker(self) -> None:
+        diff = "l1\nl2\nl3\nl4\n"
+
+        for limit in (0, 1):
+            self.assertEqual(
+                auto_commit.shorten_diff(diff, limit),
+                "... [12 Zeichen gekürzt] ...\n",
+            )
+
+    def test_truncate_diffs_keeps_diffs_within_budget_unchanged(self) -> None:
+        diffs = {"a.py": "+" * 60, "b.py": "-" * 40}
+
+        self.assertEqual(auto_commit.truncate_diffs(diffs, 100), diffs)
+
+    def test_truncate_diffs_replaces_binary_diffs(self) -> None:
+        diffs = {
+            "logo.png": "diff --git a/logo.png b/logo.png\n"
+            "Binary files a/logo.png and b/logo.png differ",
+            "a.py": "+x",
+        }
+
+        result = auto_commit.truncate_diffs(diffs, 10_000)
+
+        self.assertEqual(result["logo.png"], "Binärdatei geändert (Diff ausgelassen)")
+        self.assertEqual(result["a.py"], "+x")
+
+    def test_truncate_diffs_respects_the_total_budget(self) -> None:
+        diffs = {
+            "small.py": "+small\n",
+            "big.py": "".join(f"+line {index}\n" for index in range(5000)),
+        }
+
+        result = auto_commit.truncate_diffs(diffs, 2000)
+
+        self.assertEqual(result["small.py"], "+small\n")
+        self.assertIn("Zeichen gekürzt", result["big.py"])
+        self.assertLessEqual(sum(len(diff) for diff in result.values()), 2000 + 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from support import TemporaryRepoTestCase, auto_commit
+
+
+class GitHelpersTest(TemporaryRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.write("keep.txt", "a\nb\n")
+        self.write("old name.txt", "x\ny\nz\n")
+        self.write("gone.txt", "weg\n")
+        self.write("ümlaut.txt", "eins\n")
+        self.write("tab\tname.txt", "vorher\n")
+        self.commit_all()
+
+    def test_scan_worktree_classifies_entries(self) -> None:
+        self.git("mv", "old name.txt", "new name.txt")
+        self.git("rm", "-q", "gone.txt")
+        self.write("keep.txt", "a\nB\n")
+        self.git("add", "keep.txt")
+        self.write("keep.txt", "a\nB\nc\n")
+        self.write("ümlaut.txt", "zwei\n")
+        self.write("neu/datei.txt", "neu\n")
+
+        untracked, unstaged, staged, deleted = auto_commit.scan_worktree(self.repo)
+
+        self.assertEqual(untracked, ["neu/datei.txt"])
+        self.assertEqual(unstaged, ["keep.txt", "ümlaut.txt"])
+        self.assertEqual(staged, ["keep.txt", "new name.txt"])
+        self.assertEqual(deleted, ["gone.txt"])
+
+    def test_scan_worktree_does_not_enable_the_untracked_cache(self) -> None:
+        self.write("neu.txt", "neu\n")
+
+        auto_commit.scan_worktree(self.repo)
+
+        self.assertNotIn(b"UNTR", (self.root / ".git" / "index").read_bytes())
+
+    def test_staged_and_deleted_files_follow_renames(self) -> None:
+        self.git("mv", "old name.txt", "new name.txt")
+        self.git("rm", "-q", "gone.txt")
+        self.write("ümlaut.txt", "zwei\n")
+        self.git("add", "ümlaut.txt")
+
+        staged, deleted = auto_commit.get_staged_and_deleted_files(self.repo)
+
+        self.assertEqual(staged, ["new name.txt", "ümlaut.txt"])
+        self.assertEqual(deleted, ["gone.txt"])
+
+    def test_all_staged_diffs_match_single_file_diffs(self) -> None:
+        self.git("mv", "old name.txt", "new name.txt")
+        self.git("rm", "-q", "gone.txt")
+        self.write("keep.txt", "a\nB\n")
+        self.write("ümlaut.txt", "zwei\n")
+        self.write("tab\tname.txt", "nachher\n")
+        self.git("add", "--all")
+        self.write("keep.txt", "a\nB\nunstaged\n")
+
+        files = ["keep.txt", "new name.txt", "tab\tname.txt", "ümlaut.txt"]
+        files += ["gone.txt", "old name.txt"]
+        diffs = auto_commit.get_all_staged_diffs(self.repo, files)
+
+        self.assertEqual(list(diffs), files)
+        for path in files:
+            self.assertEqual(
+                diffs[path], auto_commit.get_diff_for_file(self.repo, path), path
+            )
+        self.assertIn("+B", diffs["keep.txt"])
+        self.assertNotIn("unstaged", diffs["keep.txt"])
+        self.assertIn("deleted file mode", diffs["gone.txt"])
+        self.assertIn("new file mode", diffs["new name.txt"])
+        # Gequotete Header landen im Fallback und nicht im vorherigen Abschnitt
+        self.assertIn("+nachher", diffs["tab\tname.txt"])
+        self.assertNotIn("nachher", diffs["new name.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
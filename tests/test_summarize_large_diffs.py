@@ -0,0 +1,122 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from unittest import mock
+
+from support import auto_commit
+
+
+class FakeStreamingClient:
+    """OpenAI-kompatibler Client, der Prompts mitschreibt und Antworten streamt."""
+
+    def __init__(self) -> None:
+        self.prompts: List[str] = []
+        self.lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model: str, messages: List[dict], stream: bool) -> object:
+        prompt = messages[0]["content"]
+        with self.lock:
+            self.prompts.append(prompt)
+        if prompt.startswith("Fasse"):
+            first_file = prompt.split("Datei: ", 1)[1].split("\n", 1)[0]
+            answer = f"- Zusammenfassung ab {first_file}"
+        else:
+            answer = "feat: final message"
+        return iter(
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=part))]
+            )
+            for part in (answer[:5], answer[5:])
+        )
+
+
+def make_diff(path: str) -> str:
+    body = "".join(f"+{path} line {index}\n" for index in range(1300))
+    return f"diff --git a/{path} b/{path}\n{body}"
+
+
+class SummarizeLargeDiffsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Fünf Diffs à ca. 20 KB: zwei passen gemeinsam in einen 48-KB-Abschnitt.
+        self.diffs = {f"f{index}.py": make_diff(f"f{index}.py") for index in range(5)}
+
+    def generate(self, client: FakeStreamingClient, summarize: bool) -> str:
+        return auto_commit.generate_commit_message(
+            self.diffs,
+            "openai",
+            "model",
+            "Deutsch",
+            "standard",
+            None,
+            client,
+            summarize_large_diffs=summarize,
+        )
+
+    def test_chunks_follow_file_order_within_the_budget(self) -> None:
+        chunks = auto_commit.split_diffs_into_chunks(
+            self.diffs, auto_commit.MAX_PROMPT_DIFF_SIZE
+        )
+
+        self.assertEqual(
+            [list(chunk) for chunk in chunks],
+            [["f0.py", "f1.py"], ["f2.py", "f3.py"], ["f4.py"]],
+        )
+        for chunk in chunks:
+            self.assertLessEqual(
+                sum(map(len, chunk.values())), auto_commit.MAX_PROMPT_DIFF_SIZE
+            )
+
+    def test_final_prompt_is_built_from_the_summaries(self) -> None:
+        client = FakeStreamingClient()
+
+        message = self.generate(client, summarize=True)
+
+        self.assertEqual(message, "feat: final message")
+        summary_prompts = [p for p in client.prompts if p.startswith("Fasse")]
+        final_prompts = [p for p in client.prompts if not p.startswith("Fasse")]
+        self.assertEqual(len(summary_prompts), 3)
+        self.assertEqual(len(final_prompts), 1)
+        final_prompt = final_prompts[0]
+        self.assertIn("Datei: f0.py, f1.py\nÄnderungen:\n", final_prompt)
+        self.assertIn("- Zusammenfassung ab f2.py", final_prompt)
+        self.assertIn("Datei: f4.py\n", final_prompt)
+        self.assertNotIn("line 0", final_prompt)
+
+    def test_summary_results_use_their_own_cache_key(self) -> None:
+        prompt = auto_commit.build_commit_prompt(self.diffs, "Deutsch", "standard")
+        truncated_key = auto_commit.commit_cache_key(
+            "openai", "model", "Deutsch", "standard", prompt
+        )
+        summary_key = auto_commit.commit_cache_key(
+            "openai", "model", "Deutsch", "standard+summary", prompt
+        )
+        self.assertNotEqual(truncated_key, summary_key)
+
+        client = FakeStreamingClient()
+        self.generate(client, summarize=True)
+        cache_dir = Path(auto_commit.get_cache_dir())
+        self.assertTrue((cache_dir / f"{summary_key}.txt").exists())
+        self.assertFalse((cache_dir / f"{truncated_key}.txt").exists())
+
+        # Der gekürzte Pfad darf den Summary-Eintrag nicht wiederverwenden.
+        self.generate(client, summarize=False)
+        self.assertEqual(len(client.prompts), 5)
+        self.assertTrue((cache_dir / f"{truncated_key}.txt").exists())
+
+        # Ein zweiter Summary-Lauf kommt komplett aus dem Cache.
+        self.generate(client, summarize=True)
+        self.assertEqual(len(client.prompts), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()